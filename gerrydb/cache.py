@@ -4,7 +4,8 @@ import gzip
 import pickle
 import sqlite3
 import os
-from datetime import datetime
+import time
+from collections import Counter, OrderedDict, deque
 from os import PathLike
 from pathlib import Path
 from typing import Optional, TypeVar, Union
@@ -15,7 +16,46 @@ from gerrydb.logging import log
 from .exceptions import CacheInitError
 
 _REQUIRED_TABLES = {"cache_meta", "graph", "view"}
-_CACHE_SCHEMA_VERSION = "0"
+_CACHE_SCHEMA_VERSION = "1"
+# Eviction is S3-FIFO (Yang et al., SOSP '23): new renders enter a small
+# probationary FIFO queue, and only renders read again while on probation are
+# promoted to the main FIFO queue, so one-off renders (e.g. a sweep over many
+# views) cannot flush renders that are used repeatedly. Renders leaving the main
+# queue are reinserted once per recorded hit, so stale hits age out.
+_SMALL_QUEUE_SHARE = 0.1  # probationary share of the size budget
+_MAX_HITS = 3  # saturating per-render hit counter
+_QUEUED_AT_INDEXES = [
+    f"CREATE INDEX IF NOT EXISTS {table}_queued_at_idx ON {table}(queued_at)"
+    for table in ("view", "graph")
+]
+# Both queues in FIFO order, read by walking the `queued_at` index.
+_EVICTION_QUERY = (
+    "SELECT namespace, path, render_id, file_size_kb, hits, queue "
+    "FROM {table} ORDER BY queued_at"
+)
+# In-place upgrades for caches written by older clients, keyed by the schema
+# version they upgrade from: (version after upgrade, statements to run).
+_SCHEMA_MIGRATIONS = {
+    # v1: `cached_at` is stored as integer microseconds since the Unix epoch
+    # rather than as local-time ISO 8601 text, and renders carry S3-FIFO
+    # eviction state (existing renders start on probation).
+    "0": (
+        "1",
+        [
+            statement
+            for table in ("view", "graph")
+            for statement in (
+                f"UPDATE {table} SET cached_at = CAST(ROUND("
+                "(julianday(cached_at, 'utc') - 2440587.5) * 86400000000) AS INTEGER)",
+                f"ALTER TABLE {table} ADD COLUMN queued_at INTEGER NOT NULL DEFAULT 0",
+                f"ALTER TABLE {table} ADD COLUMN hits INTEGER NOT NULL DEFAULT 0",
+                f"ALTER TABLE {table} ADD COLUMN queue TEXT NOT NULL DEFAULT 'small'",
+                f"UPDATE {table} SET queued_at = cached_at",
+            )
+        ]
+        + _QUEUED_AT_INDEXES,
+    ),
+}
 CACHE_EXTENSIONS = (
     "gpkg",  # view archive
     "pkl.gz",  # graph (derived from view archive)
@@ -24,11 +64,21 @@ CACHE_EXTENSIONS = (
 SchemaType = TypeVar("SchemaType", bound=BaseModel)
 
 
+def _now_us() -> int:
+    """Returns the current time in integer microseconds since the Unix epoch."""
+    return time.time_ns() // 1_000
+
+
 class GerryCache:
     """Caching layer for GerryDB."""
 
     _conn: sqlite3.Connection
     data_dir: Path
+    # Hits are buffered in memory and written with the next upsert, so reads
+    # never need the database write lock.
+    _pending_hits: dict[str, Counter]
+    # S3-FIFO ghost queues: recently evicted probationary renders (keys only).
+    _ghosts: dict[str, OrderedDict]
 
     def __init__(
         self,
@@ -42,6 +92,11 @@ class GerryCache:
         else:
             try:
                 self._conn = sqlite3.connect(database)
+                # The cache index is small and can be rebuilt from the server,
+                # so trade durability of the last write for fewer fsyncs.
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute("PRAGMA temp_store=MEMORY")
             except sqlite3.OperationalError as ex:
                 raise CacheInitError(
                     "Failed to load/initialize GerryDB cache ({database})."
@@ -54,6 +109,8 @@ class GerryCache:
 
         self.data_dir = data_dir
         self.max_size_gb = max_size_gb
+        self._pending_hits = {"view": Counter(), "graph": Counter()}
+        self._ghosts = {"view": OrderedDict(), "graph": OrderedDict()}
 
     def upsert_graph_gpkg(
         self, namespace: str, path: str, render_id: str, content: bytes
@@ -70,57 +127,36 @@ class GerryCache:
                 (namespace, path),
             ).fetchone()
             if prev_render_id is not None:
-                self._conn.execute(
-                    "DELETE FROM graph WHERE namespace = ? AND path = ?",
-                    (namespace, path),
-                )
                 log.debug(f"The previous render id is {prev_render_id}")
                 for ext in CACHE_EXTENSIONS:
                     Path(self.data_dir / f"{prev_render_id[0]}.{ext}").unlink(
                         missing_ok=True
                     )
 
+            # Replaces the previous render (if any) in the same statement.
+            self._flush_hits("graph")
+            now = _now_us()
             self._conn.execute(
                 (
-                    "INSERT INTO graph (namespace, render_id, path, cached_at, file_size_kb) "
-                    "VALUES (?, ?, ?, ?, ?)"
+                    "INSERT INTO graph (namespace, render_id, path, cached_at, queued_at, hits, queue, file_size_kb) "
+                    "VALUES (?, ?, ?, ?, ?, 0, ?, ?) "
+                    "ON CONFLICT(namespace, path) DO UPDATE SET "
+                    "render_id = excluded.render_id, cached_at = excluded.cached_at, "
+                    "queued_at = excluded.queued_at, hits = 0, queue = excluded.queue, "
+                    "file_size_kb = excluded.file_size_kb"
+                ),
+                (
+                    namespace,
+                    render_id,
+                    path,
+                    now,
+                    now,
+                    self._admission_queue("graph", namespace, path),
+                    kb_written,
                 ),
-                (namespace, render_id, path, datetime.now().isoformat(), kb_written),
             )
 
-            db_cursor = self._conn.cursor()
-
-            db_cursor.execute("SELECT SUM(file_size_kb) FROM graph")
-            total_db_size = db_cursor.fetchone()[0]
-
-            while total_db_size > self.max_size_gb * 1024 * 1024:
-                db_cursor.execute(
-                    "SELECT namespace, path, render_id, cached_at, file_size_kb FROM graph ORDER BY cached_at ASC LIMIT 1"
-                )
-                oldest = db_cursor.fetchone()
-                oldest_namespace, oldest_path, oldest_render_id = (
-                    oldest[0],
-                    oldest[1],
-                    oldest[2],
-                )
-                log.debug(f"Found oldest render: {oldest_namespace}, {oldest_path}")
-                log.debug(oldest)
-                total_db_size -= oldest[4]
-                db_cursor.execute(
-                    "DELETE FROM graph WHERE namespace = ? AND path = ?",
-                    (oldest_namespace, oldest_path),
-                )
-
-                log.debug(f"The new db size is {total_db_size}")
-                log.debug(f"Now deleting the render file: {oldest_render_id}.gpkg")
-
-                try:
-                    os.remove(self.data_dir / f"{oldest_render_id}.gpkg")
-                except FileNotFoundError:
-                    log.debug(
-                        f"Could not find the render file: {oldest_render_id}.gpkg to delete"
-                        " from cache. Skipping."
-                    )
+            self._evict("graph", namespace, path)
 
         return gpkg_path
 
@@ -145,54 +181,35 @@ class GerryCache:
                 (namespace, path),
             ).fetchone()
             if prev_render_id is not None:
-                self._conn.execute(
-                    "DELETE FROM view WHERE namespace = ? AND path = ?",
-                    (namespace, path),
-                )
                 for ext in CACHE_EXTENSIONS:
                     Path(self.data_dir / f"{prev_render_id[0]}.{ext}").unlink(
                         missing_ok=True
                     )
 
+            # Replaces the previous render (if any) in the same statement.
+            self._flush_hits("view")
+            now = _now_us()
             self._conn.execute(
                 (
-                    "INSERT INTO view (namespace, path, render_id, cached_at, file_size_kb) "
-                    "VALUES (?, ?, ?, ?, ?)"
+                    "INSERT INTO view (namespace, path, render_id, cached_at, queued_at, hits, queue, file_size_kb) "
+                    "VALUES (?, ?, ?, ?, ?, 0, ?, ?) "
+                    "ON CONFLICT(namespace, path) DO UPDATE SET "
+                    "render_id = excluded.render_id, cached_at = excluded.cached_at, "
+                    "queued_at = excluded.queued_at, hits = 0, queue = excluded.queue, "
+                    "file_size_kb = excluded.file_size_kb"
+                ),
+                (
+                    namespace,
+                    path,
+                    render_id,
+                    now,
+                    now,
+                    self._admission_queue("view", namespace, path),
+                    kb_written,
                 ),
-                (namespace, path, render_id, datetime.now().isoformat(), kb_written),
             )
 
-            db_cursor = self._conn.cursor()
-
-            db_cursor.execute("SELECT SUM(file_size_kb) FROM view")
-            total_db_size = db_cursor.fetchone()[0]
-
-            while total_db_size > self.max_size_gb * 1024 * 1024:
-                db_cursor.execute("SELECT * FROM view ORDER BY cached_at ASC LIMIT 1")
-                oldest = db_cursor.fetchone()
-                oldest_namespace, oldest_path, oldest_render_id = (
-                    oldest[0],
-                    oldest[1],
-                    oldest[2],
-                )
-                log.debug(f"Found oldest render: {oldest_namespace}, {oldest_path}")
-                log.debug(oldest)
-                total_db_size -= oldest[4]
-                db_cursor.execute(
-                    "DELETE FROM view WHERE namespace = ? AND path = ?",
-                    (oldest_namespace, oldest_path),
-                )
-
-                log.debug(f"The new db size is {total_db_size}")
-                log.debug(f"Now deleting the render file: {oldest_render_id}.gpkg")
-
-                try:
-                    os.remove(self.data_dir / f"{oldest_render_id}.gpkg")
-                except FileNotFoundError:
-                    log.debug(
-                        f"Could not find the render file: {oldest_render_id}.gpkg to delete"
-                        " from cache. Skipping."
-                    )
+            self._evict("view", namespace, path)
 
         return gpkg_path
 
@@ -208,6 +225,7 @@ class GerryCache:
         gpkg_path = self.data_dir / f"{render_id[0]}.gpkg"
         if not gpkg_path.is_file():
             return None
+        self._pending_hits["graph"][namespace, path] += 1
         return gpkg_path
 
     def get_view_gpkg(self, namespace: str, path: str) -> Optional[Path]:
@@ -224,8 +242,120 @@ class GerryCache:
             # TODO: this implies a corrupt cache index.
             # What's the right way to handle that?
             return None
+        self._pending_hits["view"][namespace, path] += 1
         return gpkg_path
 
+    def _flush_hits(self, table: str) -> None:
+        """Writes buffered hits to `table`. Must be called within a transaction."""
+        hits = self._pending_hits[table]
+        if hits:
+            self._conn.executemany(
+                f"UPDATE {table} SET hits = MIN(hits + ?, {_MAX_HITS}) "
+                "WHERE namespace = ? AND path = ?",
+                [(count, namespace, path) for (namespace, path), count in hits.items()],
+            )
+            hits.clear()
+
+    def _admission_queue(self, table: str, namespace: str, path: str) -> str:
+        """Picks the queue for a new render; recent ghosts skip probation."""
+        if self._ghosts[table].pop((namespace, path), None) is not None:
+            return "main"
+        return "small"
+
+    def _evict(self, table: str, namespace: str, path: str) -> None:
+        """Evicts renders (S3-FIFO) until the cache fits in `max_size_gb`.
+
+        The probationary queue is drained while it exceeds its share of the
+        budget: renders read since they were cached move to the main queue, the
+        rest are evicted (and remembered in the ghost queue). Otherwise, the main
+        queue is drained: renders with hits are requeued with one hit fewer, the
+        rest are evicted. The render just written (`namespace`, `path`) is never
+        evicted by its own upsert.
+
+        Must be called within a transaction. Evicted rows are deleted in a single
+        batch; their render files are removed afterwards.
+        """
+        rows = self._conn.execute(_EVICTION_QUERY.format(table=table)).fetchall()
+        max_kb = self.max_size_gb * 1024 * 1024
+        total_kb = sum(row[3] for row in rows)
+        if total_kb <= max_kb:
+            return
+
+        queues = {"small": deque(), "main": deque()}
+        small_kb = 0
+        for row_namespace, row_path, render_id, size_kb, hits, queue in rows:
+            if queue == "small":
+                small_kb += size_kb
+            if (row_namespace, row_path) != (namespace, path):
+                queues[queue].append(
+                    [row_namespace, row_path, render_id, size_kb, hits]
+                )
+
+        evicted = []
+        requeued = {}
+        queued_at = _now_us()
+        ghosts = self._ghosts[table]
+        while total_kb > max_kb:
+            if queues["small"] and (
+                small_kb > max_kb * _SMALL_QUEUE_SHARE or not queues["main"]
+            ):
+                entry = queues["small"].popleft()
+                small_kb -= entry[3]
+                if entry[4] > 0:
+                    entry[4] = 0
+                    keep = True
+                else:
+                    keep = False
+                    ghosts[entry[0], entry[1]] = True
+                    ghosts.move_to_end((entry[0], entry[1]))  # newest ghost last
+            elif queues["main"]:
+                entry = queues["main"].popleft()
+                keep = entry[4] > 0
+                if keep:
+                    entry[4] -= 1
+            else:
+                break
+
+            key = (entry[0], entry[1])
+            if keep:
+                queued_at += 1
+                queues["main"].append(entry)
+                requeued[key] = ("main", entry[4], queued_at)
+            else:
+                log.debug(f"Evicting render: {entry[0]}, {entry[1]}")
+                requeued.pop(key, None)
+                evicted.append(entry)
+                total_kb -= entry[3]
+
+        # The ghost queue remembers about as many renders as the cache holds.
+        while len(ghosts) > len(rows):
+            ghosts.popitem(last=False)
+
+        self._conn.executemany(
+            f"UPDATE {table} SET queue = ?, hits = ?, queued_at = ? "
+            "WHERE namespace = ? AND path = ?",
+            [(*state, *key) for key, state in requeued.items()],
+        )
+        if not evicted:
+            return
+
+        self._conn.executemany(
+            f"DELETE FROM {table} WHERE namespace = ? AND path = ?",
+            [(entry[0], entry[1]) for entry in evicted],
+        )
+        log.debug(f"Evicted {len(evicted)} render(s) from {table}")
+
+        for entry in evicted:
+            render_id = entry[2]
+            log.debug(f"Now deleting the render file: {render_id}.gpkg")
+            try:
+                os.remove(self.data_dir / f"{render_id}.gpkg")
+            except FileNotFoundError:
+                log.debug(
+                    f"Could not find the render file: {render_id}.gpkg to delete"
+                    " from cache. Skipping."
+                )
+
     def _commit(self) -> bool:
         """Commits the cache transaction."""
         self._conn.execute("COMMIT")
@@ -254,12 +384,48 @@ class GerryCache:
         ).fetchone()
         if schema_version is None:
             raise CacheInitError("Invalid cache: no schema version in cache metadata.")
-        if schema_version[0] != _CACHE_SCHEMA_VERSION:
+        schema_version = self._migrate(schema_version[0])
+        if schema_version != _CACHE_SCHEMA_VERSION:
             raise CacheInitError(
                 f"Invalid cache: expected schema version {_CACHE_SCHEMA_VERSION}, "
-                f"but got schema version {schema_version[0]}."
+                f"but got schema version {schema_version}."
             )
 
+    def _migrate(self, schema_version: str) -> str:
+        """Upgrades the cache schema in place from `schema_version`, if possible.
+
+        Each upgrade step runs in its own explicit transaction (DDL does not
+        implicitly open one), so a failed step leaves the cache untouched.
+
+        Returns:
+            The schema version after all applicable upgrades.
+
+        Raises:
+            CacheInitError: If an upgrade step fails.
+        """
+        while schema_version in _SCHEMA_MIGRATIONS:
+            next_version, statements = _SCHEMA_MIGRATIONS[schema_version]
+            log.debug(
+                f"Migrating cache from schema version {schema_version} to {next_version}"
+            )
+            try:
+                self._conn.execute("BEGIN")
+                for statement in statements:
+                    self._conn.execute(statement)
+                self._conn.execute(
+                    "UPDATE cache_meta SET value = ? WHERE key = 'schema_version'",
+                    (next_version,),
+                )
+                self._conn.commit()
+            except sqlite3.Error as ex:
+                self._conn.rollback()
+                raise CacheInitError(
+                    f"Failed to migrate cache from schema version {schema_version} "
+                    f"to {next_version}."
+                ) from ex
+            schema_version = next_version
+        return schema_version
+
     def _init_db(self) -> None:
         """Initializes GerryDB cache tables."""
         self._conn.execute(
@@ -273,8 +439,11 @@ class GerryCache:
                 namespace        TEXT       NOT NULL,
                 path             TEXT       NOT NULL,
                 render_id        TEXT       NOT NULL,
-                cached_at        TIMESTAMP  NOT NULL,
+                cached_at        INTEGER    NOT NULL,
                 file_size_kb     BIGINTEGER NOT NULL,
+                queued_at        INTEGER    NOT NULL DEFAULT 0,
+                hits             INTEGER    NOT NULL DEFAULT 0,
+                queue            TEXT       NOT NULL DEFAULT 'small',
                 UNIQUE(namespace, path)
             )"""
         )
@@ -283,13 +452,18 @@ class GerryCache:
                 namespace      TEXT       NOT NULL,
                 render_id      TEXT       NOT NULL,
                 path           TEXT       NOT NULL,
-                cached_at      TIMESTAMP  NOT NULL,
+                cached_at      INTEGER    NOT NULL,
                 file_size_kb   BIGINTEGER NOT NULL,
+                queued_at      INTEGER    NOT NULL DEFAULT 0,
+                hits           INTEGER    NOT NULL DEFAULT 0,
+                queue          TEXT       NOT NULL DEFAULT 'small',
                 UNIQUE(namespace, path)
             )"""
         )
+        for statement in _QUEUED_AT_INDEXES:
+            self._conn.execute(statement)
         self._conn.execute(
             "INSERT INTO cache_meta (key, value) VALUES ('schema_version', ?)",
-            _CACHE_SCHEMA_VERSION,
+            (_CACHE_SCHEMA_VERSION,),
         )
         self._conn.commit()
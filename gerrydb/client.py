@@ -1,6 +1,5 @@
 """GerryDB session management."""
 
-import asyncio
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -31,7 +30,7 @@ from gerrydb.repos import (
     ViewRepo,
     ViewTemplateRepo,
 )
-from gerrydb.repos.base import normalize_path
+from gerrydb.repos.base import HTTP_LIMITS, _run, gather_batch, normalize_path
 from gerrydb.repos.geography import GeoValType
 from gerrydb.schemas import (
     Column,
@@ -52,32 +51,6 @@ from gerrydb.logging import log
 DEFAULT_GERRYDB_ROOT = Path(os.path.expanduser("~")) / ".gerrydb"
 
 
-def _run(coro):  # pragma: no cover
-    """
-    Run any coroutine from synchronous code.
-    If there's no running loop, use asyncio.run().
-    If there _is_ a loop (e.g. in Jupyter), auto-apply nest_asyncio
-    and drive it to completion.
-    """
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        # no loop running so safe to start a fresh one
-        return asyncio.run(coro)
-    else:
-        # loop already running
-        try:
-            import nest_asyncio
-        except ImportError:
-            raise RuntimeError(
-                "Detected an existing asyncio loop, "
-                "but `nest_asyncio` is not installed. "
-                "Please add it to your dependencies."
-            )
-        nest_asyncio.apply(loop)
-        return loop.run_until_complete(coro)
-
-
 class GerryDB:
     """GerryDB session."""
 
@@ -197,7 +170,7 @@ class GerryDB:
             else f"https://{host}/api/v1"
         )
         self._base_headers = {"User-Agent": "gerrydb-client-py", "X-API-Key": key}
-        self._transport = httpx.HTTPTransport(retries=1)
+        self._transport = httpx.HTTPTransport(retries=1, limits=HTTP_LIMITS)
 
         self.client = httpx.Client(
             base_url=self._base_url,
@@ -703,7 +676,7 @@ class WriteContext:
                 f"or create a new locality with only the relevant geographies."
             )
 
-    def __validate_columns(self, columns):
+    def __validate_columns(self, columns) -> dict[str, Column]:
         """
         Private method called by the `load_dataframe` method to validate the columns
         passed to the method.
@@ -722,6 +695,9 @@ class WriteContext:
             ValueError: If some of the columns in `columns` do not exist in the database.
                 This also looks for close matches to the columns in the database
                 and prints them out for the user.
+
+        Returns:
+            The columns in the database, keyed by canonical path and by alias.
         """
 
         log.debug(columns)
@@ -736,13 +712,13 @@ class WriteContext:
                 f"Received type {type(columns)}."
             )
 
+        db_columns = {}
         if isinstance(columns, list) or isinstance(columns, pdIndex):
-            column_paths = []
             for col in self.db.columns.all():
-                column_paths.append(col.canonical_path)
-                column_paths.extend(col.aliases)
+                db_columns[col.canonical_path] = col
+                db_columns.update((alias, col) for alias in col.aliases)
 
-            column_paths = set(column_paths)
+            column_paths = set(db_columns)
             cur_columns = set([normalize_path(col) for col in columns])
 
             for col in cur_columns:
@@ -761,7 +737,8 @@ class WriteContext:
                         f"Found a dictionary with a value of type {type(item)}."
                     )
 
-            column_paths = {col.canonical_path for col in self.db.columns.all()}
+            db_columns = {col.canonical_path: col for col in self.db.columns.all()}
+            column_paths = set(db_columns)
             cur_columns = set([v.canonical_path for v in columns.values()])
 
         log.debug("COLUMN PATHS: %s", column_paths)
@@ -780,6 +757,8 @@ class WriteContext:
                 f"Please create the missing columns first using the `db.columns.create` method."
             )
 
+        return db_columns
+
     def __validate_load_types(
         self,
         df: Union[pd.DataFrame, gpd.GeoDataFrame],
@@ -994,14 +973,13 @@ class WriteContext:
             )
 
         log.debug("VALIDATING COLUMNS")
-        self.__validate_columns(columns)
+        db_columns = self.__validate_columns(columns)
 
-        # TODO: Check to see if grabbing all of the columns and then filtering
-        # is significantly different from a data transfer perspective in the
-        # average case.
+        # Resolve columns from the listing fetched during validation; only
+        # DataFrame columns it does not cover need their own request.
         if not isinstance(columns, dict):
             columns = {
-                c: self.columns.get(c)
+                c: db_columns.get(normalize_path(c)) or self.columns.get(c)
                 for c in df.columns
                 if c not in ["geometry", "internal_point"]
             }
@@ -1012,18 +990,6 @@ class WriteContext:
         log.debug("FINISHED LOADING DATAFRAME")
 
 
-# based on https://stackoverflow.com/a/61478547
-async def gather_batch(coros, n):
-    """Limits concurrency of a batch of coroutines."""
-    semaphore = asyncio.Semaphore(n)
-
-    async def sem_coro(coro):
-        async with semaphore:
-            return await coro
-
-    return await asyncio.gather(*(sem_coro(c) for c in coros), return_exceptions=True)
-
-
 async def _load_geos(
     repo: GeographyRepo,
     geos: dict[str, GeoValType],
@@ -1085,7 +1051,7 @@ async def _load_column_values(
 ) -> None:
     """Asynchronously loads column values from a DataFrame in batches."""
     params = repo.ctx.client_params.copy()
-    params["transport"] = httpx.AsyncHTTPTransport(retries=1)
+    params["transport"] = httpx.AsyncHTTPTransport(retries=1, limits=HTTP_LIMITS)
 
     val_batches: list[tuple[Column, dict[str, Any]]] = []
     for col_name, col_meta in columns.items():
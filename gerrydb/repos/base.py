@@ -1,10 +1,25 @@
 """Base objects and utilities for GerryDB API object repositories."""
 
+import asyncio
+import inspect
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from functools import wraps
-from typing import TYPE_CHECKING, Callable, Generic, Optional, Tuple, TypeVar, Union
+from functools import lru_cache, wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import httpx
+import orjson
 import pydantic
 
 from gerrydb.exceptions import (
@@ -24,6 +39,42 @@ if TYPE_CHECKING:
 SchemaType = TypeVar("SchemaType", bound=BaseModel)
 
 NAMESPACE_ERR = "No namespace specified for all() query, and no default available."
+DEFAULT_NAMESPACE_ERR = "No namespace specified and no session-level default available."
+
+# Connection pool limits for all API transports. Idle connections are kept alive
+# long enough to be reused across gaps between sequential writes (e.g. successive
+# `create()` calls in an ingest script) instead of paying a new TLS handshake.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0
+)
+
+# Headers for request bodies pre-serialized with `orjson.dumps()`.
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _raise_repo_error(message: str, ex: Exception) -> None:
+    """Re-raises HTTP request and Pydantic validation errors as `ResultError`s.
+
+    Other exceptions are left for the caller to re-raise.
+    """
+    if isinstance(ex, pydantic.ValidationError):
+        raise ResultError(f"{message}: cannot parse response.") from ex
+    if isinstance(ex, httpx.HTTPError):
+        reason = f" Reason: {ex.response.json()}" if hasattr(ex, "response") else ""
+        raise ResultError(f"{message}: HTTP request failed.{reason}") from ex
+    # only intercept the “line_errors” signature‐mismatch
+    if isinstance(ex, TypeError) and "line_errors" in str(ex):
+        raise ResultError(f"{message}: cannot parse") from ex
+
+
+@lru_cache(maxsize=256)
+def _namespace_url(base_url: str, namespace: str) -> httpx.URL:
+    """Returns the (parsed) collection endpoint for `namespace` under `base_url`.
+
+    Repository objects are rebuilt on every access, so parsed URLs are
+    memoized here rather than on the repository.
+    """
+    return httpx.URL(f"{base_url}/{namespace}")
 
 
 def err(message: str) -> Callable:
@@ -34,18 +85,8 @@ def err(message: str) -> Callable:
         def err_wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except pydantic.ValidationError as ex:
-                raise ResultError(f"{message}: cannot parse response.") from ex
-            except httpx.HTTPError as ex:
-                reason = (
-                    f" Reason: {ex.response.json()}" if hasattr(ex, "response") else ""
-                )
-                raise ResultError(f"{message}: HTTP request failed.{reason}") from ex
-            except TypeError as e:
-                # only intercept the “line_errors” signature‐mismatch
-                if "line_errors" in str(e):
-                    raise ResultError(f"{message}: cannot parse") from e
-                # otherwise re-raise
+            except (pydantic.ValidationError, httpx.HTTPError, TypeError) as ex:
+                _raise_repo_error(message, ex)
                 raise
 
         return err_wrapper
@@ -75,34 +116,38 @@ def namespaced(func: Callable) -> Callable:
 
     @wraps(func)
     def namespaced_wrapper(*args, **kwargs):
-        repo_obj = args[0]
-
-        # Both `path` and `namespace` can be passed as positional or
-        # keyword arguments, which necessitates this messy parsing.
-        if "path" in kwargs:
-            path = kwargs["path"]
-            del kwargs["path"]
-        else:
-            path = args[1]
-
-        if "namespace" in kwargs:
-            namespace = kwargs["namespace"]
-            del kwargs["namespace"]
-        else:
-            namespace = (
-                args[2]
-                if len(args) >= 3 and args[2] is not None
-                else repo_obj.session.namespace
-            )
+        return func(*_namespaced_args(args, kwargs), **kwargs)
 
-        if namespace is None:
-            raise RequestError(
-                "No namespace specified and no session-level default available."
-            )
+    return namespaced_wrapper
 
-        return func(repo_obj, path, namespace, *args[3:], **kwargs)
 
-    return namespaced_wrapper
+def _namespaced_args(args: tuple, kwargs: dict[str, Any]) -> tuple:
+    """Resolves positional arguments for a `@namespaced` function.
+
+    `path` and `namespace` are popped from `kwargs` if present.
+    """
+    repo_obj = args[0]
+
+    # Both `path` and `namespace` can be passed as positional or
+    # keyword arguments, which necessitates this messy parsing.
+    if "path" in kwargs:
+        path = kwargs.pop("path")
+    else:
+        path = args[1]
+
+    if "namespace" in kwargs:
+        namespace = kwargs.pop("namespace")
+    else:
+        namespace = (
+            args[2]
+            if len(args) >= 3 and args[2] is not None
+            else repo_obj.session.namespace
+        )
+
+    if namespace is None:
+        raise RequestError(DEFAULT_NAMESPACE_ERR)
+
+    return (repo_obj, path, namespace, *args[3:])
 
 
 def write_context(func: Callable) -> Callable:
@@ -117,6 +162,102 @@ def write_context(func: Callable) -> Callable:
     return write_context_wrapper
 
 
+def repo_method(
+    message: str,
+    *,
+    namespaced: bool = False,
+    write: bool = False,
+    online: bool = False,
+) -> Callable:
+    """Fused form of the `@err`, `@namespaced`, `@write_context`, and `@online` stack.
+
+    `@repo_method(msg, namespaced=True, write=True, online=True)` behaves like
+
+        @err(msg)
+        @namespaced
+        @write_context
+        @online
+
+    but performs all checks in a single wrapper, which matters for methods
+    called in tight loops (e.g. bulk ingest). Unlike the individual decorators,
+    it also handles coroutine functions: checks run when the coroutine is
+    awaited, and errors raised while awaiting it are translated.
+    """
+
+    def repo_method_decorator(func: Callable) -> Callable:
+        def check_args(args: tuple, kwargs: dict[str, Any]) -> tuple:
+            if namespaced:
+                args = _namespaced_args(args, kwargs)
+            repo_obj = args[0]
+            if write and repo_obj.ctx is None:
+                raise WriteContextError("Operation requires a write context.")
+            if online and repo_obj.session.offline:
+                raise OnlineError("Operation can only be performed in online mode.")
+            return args
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_repo_method_wrapper(*args, **kwargs):
+                try:
+                    return await func(*check_args(args, kwargs), **kwargs)
+                except (pydantic.ValidationError, httpx.HTTPError, TypeError) as ex:
+                    _raise_repo_error(message, ex)
+                    raise
+
+            return async_repo_method_wrapper
+
+        @wraps(func)
+        def repo_method_wrapper(*args, **kwargs):
+            try:
+                return func(*check_args(args, kwargs), **kwargs)
+            except (pydantic.ValidationError, httpx.HTTPError, TypeError) as ex:
+                _raise_repo_error(message, ex)
+                raise
+
+        return repo_method_wrapper
+
+    return repo_method_decorator
+
+
+def _run(coro):  # pragma: no cover
+    """
+    Run any coroutine from synchronous code.
+    If there's no running loop, use asyncio.run().
+    If there _is_ a loop (e.g. in Jupyter), auto-apply nest_asyncio
+    and drive it to completion.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # no loop running so safe to start a fresh one
+        return asyncio.run(coro)
+    else:
+        # loop already running
+        try:
+            import nest_asyncio
+        except ImportError:
+            raise RuntimeError(
+                "Detected an existing asyncio loop, "
+                "but `nest_asyncio` is not installed. "
+                "Please add it to your dependencies."
+            )
+        nest_asyncio.apply(loop)
+        return loop.run_until_complete(coro)
+
+
+# based on https://stackoverflow.com/a/61478547
+async def gather_batch(coros, n):
+    """Limits concurrency of a batch of coroutines."""
+    semaphore = asyncio.Semaphore(n)
+
+    async def sem_coro(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(sem_coro(c) for c in coros), return_exceptions=True)
+
+
 # These characters are most likely to appear in the resource_id part of
 # a path (typically the last segment). Exclusion of these characters
 # prevents ogr2ogr fails and helps protect against malicious code injection.
@@ -180,6 +321,15 @@ class NamespacedObjectRepo(Generic[SchemaType]):
     session: "GerryDB"
     ctx: Optional["WriteContext"] = None
 
+    def _parse_response(self, response: httpx.Response) -> SchemaType:
+        """Parses an object returned by the server.
+
+        The raw body is validated directly (`model_validate_json`), which skips
+        the intermediate `dict` but still builds nested models (e.g. the
+        columns of a `ColumnSet`) properly.
+        """
+        return self.schema.model_validate_json(response.content)
+
     @err("Failed to load objects")
     def all(self, namespace: Optional[str] = None) -> list[SchemaType]:
         """Gets all objects in a namespace."""
@@ -188,9 +338,9 @@ class NamespacedObjectRepo(Generic[SchemaType]):
         if namespace is None:
             raise RequestError(NAMESPACE_ERR)
 
-        response = self.session.client.get(f"{self.base_url}/{namespace}")
+        response = self.session.client.get(_namespace_url(self.base_url, namespace))
         response.raise_for_status()
-        return [self.schema(**obj) for obj in response.json()]
+        return [self.schema(**obj) for obj in orjson.loads(response.content)]
 
     @err("Failed to load object")
     @namespaced
@@ -205,7 +355,51 @@ class NamespacedObjectRepo(Generic[SchemaType]):
 
         response = self.session.client.get(f"{self.base_url}/{namespace}/{path}")
         response.raise_for_status()
-        return self.schema(**response.json())
+        return self._parse_response(response)
+
+    @asynccontextmanager
+    async def _async_client(
+        self, client: Optional[httpx.AsyncClient] = None
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Yields `client`, or an ephemeral client for the write context if `None`."""
+        if client is not None:
+            yield client
+            return
+
+        params = self.ctx.client_params.copy()
+        params["transport"] = httpx.AsyncHTTPTransport(retries=1, limits=HTTP_LIMITS)
+        async with httpx.AsyncClient(**params) as ephemeral_client:
+            yield ephemeral_client
+
+    async def _async_post(
+        self, client: httpx.AsyncClient, url: Any, request: dict[str, Any]
+    ) -> SchemaType:
+        """Posts a pre-built request (`content`, `headers`, ...) to `url` and
+        parses the created object."""
+        response = await client.post(url, **request)
+        response.raise_for_status()
+        return self._parse_response(response)
+
+    def _gather_with_client(
+        self,
+        make_coros: Callable[[httpx.AsyncClient], list[Awaitable[Any]]],
+        max_conns: int,
+    ) -> list[Any]:
+        """Runs the coroutines built by `make_coros` over one shared async client.
+
+        At most `max_conns` coroutines run at once. All of them are run; the
+        first failure (if any) is raised afterwards.
+        """
+
+        async def gather() -> list[Any]:
+            async with self._async_client() as client:
+                return await gather_batch(make_coros(client), max_conns)
+
+        results = _run(gather())
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
 
     def __getitem__(self, key: Union[str, Tuple[str, str]]) -> Optional[SchemaType]:
         path = key
@@ -4,8 +4,12 @@ from typing import Any, Optional, Union
 
 import httpx
 import numpy as np
+import orjson
+from pydantic import TypeAdapter
 
 from gerrydb.repos.base import (
+    HTTP_LIMITS,
+    JSON_HEADERS,
     NamespacedObjectRepo,
     err,
     namespaced,
@@ -25,6 +29,9 @@ from gerrydb.schemas import (
 
 from gerrydb.logging import log
 
+# Built once: validates and serializes a whole batch of column values in one call.
+_COLUMN_VALUES = TypeAdapter(list[ColumnValue])
+
 
 class ColumnRepo(NamespacedObjectRepo[Column]):
     """Repository for columns."""
@@ -123,7 +130,7 @@ class ColumnRepo(NamespacedObjectRepo[Column]):
         response = self.session.client.get(f"/columns/{self.session.namespace}")
         response.raise_for_status()
 
-        return [Column(**item) for item in response.json()]
+        return [Column(**item) for item in orjson.loads(response.content)]
 
     @err("Failed to retrieve column")
     @online
@@ -173,17 +180,8 @@ class ColumnRepo(NamespacedObjectRepo[Column]):
 
         response = self.ctx.client.put(
             clean_path,
-            json=[
-                ColumnValue(
-                    path=(
-                        f"/{geo.namespace}/{geo.path}"
-                        if isinstance(geo, Geography)
-                        else geo
-                    ),
-                    value=value,
-                ).model_dump(mode="json")
-                for geo, value in values.items()
-            ],
+            content=_serialize_values(values),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
 
@@ -232,25 +230,18 @@ class ColumnRepo(NamespacedObjectRepo[Column]):
         ephemeral_client = client is None
         if ephemeral_client:
             params = self.ctx.client_params.copy()
-            params["transport"] = httpx.AsyncHTTPTransport(retries=1)
+            params["transport"] = httpx.AsyncHTTPTransport(
+                retries=1, limits=HTTP_LIMITS
+            )
             client = httpx.AsyncClient(**params)
 
         # Peter Note: the geos are generally strings here
-        json = [
-            ColumnValue(
-                path=(
-                    f"/{geo.namespace}/{geo.path}"
-                    if isinstance(geo, Geography)
-                    else geo
-                ),
-                value=_coerce(value),
-            ).model_dump(mode="json")
-            for geo, value in values.items()
-        ]
+        content = _serialize_values(values, coerce=True)
         log.debug("PUT request to %s", clean_path)
         response = await client.put(
             clean_path,
-            json=json,
+            content=content,
+            headers=JSON_HEADERS,
         )
 
         if response.status_code != 204:
@@ -262,6 +253,27 @@ class ColumnRepo(NamespacedObjectRepo[Column]):
             await client.aclose()
 
 
+def _serialize_values(
+    values: dict[Union[str, Geography], Any], coerce: bool = False
+) -> bytes:
+    """Serializes a geography -> value mapping as a JSON list of `ColumnValue`s."""
+    return _COLUMN_VALUES.dump_json(
+        _COLUMN_VALUES.validate_python(
+            [
+                {
+                    "path": (
+                        f"/{geo.namespace}/{geo.path}"
+                        if isinstance(geo, Geography)
+                        else geo
+                    ),
+                    "value": _coerce(value) if coerce else value,
+                }
+                for geo, value in values.items()
+            ]
+        )
+    )
+
+
 def _coerce(val: Any) -> Any:  # pragma: no cover
     """Coerces values for JSON serialization."""
     if isinstance(val, np.int64):
@@ -1,25 +1,83 @@
 """Repository for column sets."""
 
-from typing import Optional, Union
+from typing import Any, Optional, Union
+
+import httpx
+import orjson
 
 from gerrydb.exceptions import RequestError
 from gerrydb.repos.base import (
+    JSON_HEADERS,
+    DEFAULT_NAMESPACE_ERR,
     NamespacedObjectRepo,
-    err,
-    namespaced,
-    online,
-    write_context,
+    _namespace_url,
+    repo_method,
 )
-from gerrydb.schemas import Column, ColumnSet, ColumnSetCreate
+from gerrydb.schemas import Column, ColumnSet
+
+
+def _split_column_path(column: str, namespace: str) -> tuple[str, str]:
+    """Splits a column path into a `(namespace, relative path)` pair."""
+    if "/" not in column:
+        return namespace, column
+
+    col_list = column.split("/")
+    if len(col_list) != 2:
+        raise RequestError(
+            "Column paths must be in the form of either "
+            "namespace/column_name or just column_name"
+        )
+    return col_list[0], col_list[1]
+
+
+def _column_paths(columns: list[Union[str, Column]], namespace: str) -> list[str]:
+    """Resolves columns to paths relative to `namespace`.
+
+    Raises:
+        RequestError: If a column path is malformed or a column is not
+            in `namespace`.
+    """
+    resolved = [
+        (
+            (column.namespace, column.canonical_path)
+            if isinstance(column, Column)
+            else _split_column_path(column, namespace)
+        )
+        for column in columns
+    ]
+
+    col_namespace = next((ns for ns, _ in resolved if ns != namespace), None)
+    if col_namespace is not None:
+        raise RequestError(
+            f"All columns in a column set must come the same namespace "
+            f"as the database context. "
+            f"Expected: {namespace}, got: {col_namespace}"
+        )
+    return [col_rel_path for _, col_rel_path in resolved]
+
+
+def _column_set_request(
+    path: str, namespace: str, columns: list[Union[str, Column]], description: str
+) -> dict[str, Any]:
+    """Builds the request arguments for creating a column set in `namespace`."""
+    return {
+        "content": orjson.dumps(
+            {
+                "path": path,
+                "columns": _column_paths(columns, namespace),
+                "description": description,
+            }
+        ),
+        "headers": JSON_HEADERS,
+    }
 
 
 class ColumnSetRepo(NamespacedObjectRepo[ColumnSet]):
     """Repository for column sets."""
 
-    @err("Failed to create column set")
-    @namespaced
-    @write_context
-    @online
+    @repo_method(
+        "Failed to create column set", namespaced=True, write=True, online=True
+    )
     def create(
         self,
         path: str,
@@ -42,40 +100,93 @@ class ColumnSetRepo(NamespacedObjectRepo[ColumnSet]):
         Returns:
             The new column set.
         """
-        column_paths = []
-        for column in columns:
-            if isinstance(column, Column):
-                col_namespace = column.namespace
-                col_rel_path = column.canonical_path
-            else:
-                col_list = column.split("/")
-                if len(col_list) == 1:
-                    col_namespace = namespace
-                    col_rel_path = col_list[0]
-                elif len(col_list) == 2:
-                    col_namespace, col_rel_path = col_list[0], col_list[1]
-                else:
-                    raise RequestError(
-                        "Column paths must be in the form of either "
-                        "namespace/column_name or just column_name"
-                    )
-
-            if col_namespace != namespace:
-                raise RequestError(
-                    f"All columns in a column set must come the same namespace "
-                    f"as the database context. "
-                    f"Expected: {namespace}, got: {col_namespace}"
-                )
-            column_paths.append(col_rel_path)
-
         response = self.ctx.client.post(
-            f"{self.base_url}/{namespace}",
-            json=ColumnSetCreate(
-                path=path,
-                columns=column_paths,
-                description=description,
-            ).model_dump(mode="json"),
+            _namespace_url(self.base_url, namespace),
+            **_column_set_request(path, namespace, columns, description),
         )
         response.raise_for_status()
 
-        return self.schema(**response.json())
+        return self._parse_response(response)
+
+    @repo_method(
+        "Failed to create column set", namespaced=True, write=True, online=True
+    )
+    async def async_create(
+        self,
+        path: str,
+        namespace: Optional[str] = None,
+        *,
+        columns: list[Union[str, Column]],
+        description: str,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> ColumnSet:
+        """Asynchronously creates a column set.
+
+        Args:
+            path: A short identifier for the column set (e.g. `vap`).
+            columns: The columns in the column set.
+            description: Longform description of the column set.
+            client: Asynchronous API client to use (for efficient connection pooling
+                across many requests).
+
+        Raises:
+            RequestError: If the column set cannot be created on the server side,
+                or if the parameters fail validation.
+
+        Returns:
+            The new column set.
+        """
+        request = _column_set_request(path, namespace, columns, description)
+        async with self._async_client(client) as client:
+            return await self._async_post(
+                client, _namespace_url(self.base_url, namespace), request
+            )
+
+    @repo_method("Failed to create column sets", write=True, online=True)
+    def create_bulk(
+        self,
+        column_sets: list[dict[str, Any]],
+        namespace: Optional[str] = None,
+        *,
+        max_conns: int = 8,
+    ) -> list[ColumnSet]:
+        """Creates several column sets concurrently.
+
+        Each column set is still created by its own request, but up to
+        `max_conns` requests are in flight at once.
+
+        Args:
+            column_sets: Keyword arguments for `create()` (`path`, `columns`,
+                and `description`), one mapping per column set.
+            namespace: Namespace of the column sets and their columns.
+            max_conns: Maximum number of simultaneous API connections.
+
+        Raises:
+            RequestError: If any column set cannot be created on the server side,
+                or if the parameters fail validation. Column sets that were
+                created before the failure are not rolled back.
+
+        Returns:
+            The new column sets, in the order given.
+        """
+        namespace = self.session.namespace if namespace is None else namespace
+        if namespace is None:
+            raise RequestError(DEFAULT_NAMESPACE_ERR)
+
+        # Validate every column set before sending anything.
+        requests = [
+            _column_set_request(
+                column_set["path"],
+                namespace,
+                column_set["columns"],
+                column_set["description"],
+            )
+            for column_set in column_sets
+        ]
+        url = _namespace_url(self.base_url, namespace)
+        return self._gather_with_client(
+            lambda client: [
+                self._async_post(client, url, request) for request in requests
+            ],
+            max_conns,
+        )
@@ -1,25 +1,28 @@
 """Repository for geographic layers."""
 
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
+import httpx
+import orjson
+
+from gerrydb.exceptions import RequestError
 from gerrydb.repos.base import (
+    JSON_HEADERS,
+    DEFAULT_NAMESPACE_ERR,
     NamespacedObjectRepo,
-    err,
-    namespaced,
-    online,
-    write_context,
+    _namespace_url,
+    repo_method,
 )
-from gerrydb.schemas import Geography, GeoLayer, GeoLayerCreate, GeoSetCreate, Locality
+from gerrydb.schemas import Geography, GeoLayer, Locality
 from gerrydb.logging import log
 
 
 class GeoLayerRepo(NamespacedObjectRepo[GeoLayer]):
     """Repository for geographic layers."""
 
-    @err("Failed to create geographic layer")
-    @namespaced
-    @write_context
-    @online
+    @repo_method(
+        "Failed to create geographic layer", namespaced=True, write=True, online=True
+    )
     def create(
         self,
         path: str,
@@ -44,18 +47,95 @@ class GeoLayerRepo(NamespacedObjectRepo[GeoLayer]):
             The new geographic layer.
         """
         response = self.ctx.client.post(
-            f"{self.base_url}/{namespace}",
-            json=GeoLayerCreate(
-                path=path, description=description, source_url=source_url
-            ).model_dump(mode="json"),
+            _namespace_url(self.base_url, namespace),
+            **_geo_layer_request(path, description, source_url),
         )
         response.raise_for_status()
 
-        return self.schema(**response.json())
+        return self._parse_response(response)
+
+    @repo_method(
+        "Failed to create geographic layer", namespaced=True, write=True, online=True
+    )
+    async def async_create(
+        self,
+        path: str,
+        namespace: Optional[str] = None,
+        *,
+        description: Optional[str] = None,
+        source_url: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> GeoLayer:
+        """Asynchronously creates a geographic layer.
+
+        Args:
+            path: A short identifier for the layer (e.g. `block_groups`).
+            description: Longform description of the layer.
+            source_url: Original source of the layer
+                (e.g. a link to a shapefile on the U.S. Census Bureau website).
+            client: Asynchronous API client to use (for efficient connection pooling
+                across many requests).
 
-    @err("Failed to map locality to geographic layer")
-    @write_context
-    @online
+        Raises:
+            RequestError: If the layer cannot be created on the server side,
+                or if the parameters fail validation.
+
+        Returns:
+            The new geographic layer.
+        """
+        request = _geo_layer_request(path, description, source_url)
+        async with self._async_client(client) as client:
+            return await self._async_post(
+                client, _namespace_url(self.base_url, namespace), request
+            )
+
+    @repo_method("Failed to create geographic layers", write=True, online=True)
+    def create_bulk(
+        self,
+        layers: list[dict[str, Any]],
+        namespace: Optional[str] = None,
+        *,
+        max_conns: int = 8,
+    ) -> list[GeoLayer]:
+        """Creates several geographic layers concurrently.
+
+        Each layer is still created by its own request, but up to
+        `max_conns` requests are in flight at once.
+
+        Args:
+            layers: Keyword arguments for `create()` (`path` and optionally
+                `description` and `source_url`), one mapping per layer.
+            namespace: Namespace of the layers.
+            max_conns: Maximum number of simultaneous API connections.
+
+        Raises:
+            RequestError: If any layer cannot be created on the server side,
+                or if the parameters fail validation. Layers that were
+                created before the failure are not rolled back.
+
+        Returns:
+            The new geographic layers, in the order given.
+        """
+        namespace = self.session.namespace if namespace is None else namespace
+        if namespace is None:
+            raise RequestError(DEFAULT_NAMESPACE_ERR)
+
+        # Build every request body before sending anything.
+        requests = [
+            _geo_layer_request(
+                layer["path"], layer.get("description"), layer.get("source_url")
+            )
+            for layer in layers
+        ]
+        url = _namespace_url(self.base_url, namespace)
+        return self._gather_with_client(
+            lambda client: [
+                self._async_post(client, url, request) for request in requests
+            ],
+            max_conns,
+        )
+
+    @repo_method("Failed to map locality to geographic layer", write=True, online=True)
     def map_locality(
         self,
         layer: GeoLayer,
@@ -74,18 +154,65 @@ class GeoLayerRepo(NamespacedObjectRepo[GeoLayer]):
         )
         response = self.ctx.client.put(
             f"{self.base_url}/{layer.namespace}/{layer.path}",
-            params={
-                "locality": (
-                    locality.canonical_path
-                    if isinstance(locality, Locality)
-                    else locality
-                )
-            },
-            json=GeoSetCreate(
-                paths=[
-                    geo if isinstance(geo, str) else geo.full_path
-                    for geo in geographies
-                ]
-            ).model_dump(mode="json"),
+            **_locality_mapping(locality, geographies),
         )
         response.raise_for_status()
+
+    @repo_method("Failed to map locality to geographic layer", write=True, online=True)
+    async def async_map_locality(
+        self,
+        layer: GeoLayer,
+        locality: Union[str, Locality],
+        geographies: list[Union[str, Geography]],
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        """Asynchronously maps a set of `geographies` to `layer` in `locality`.
+
+        Args:
+            client: Asynchronous API client to use (for efficient connection pooling
+                across many requests).
+
+        Raises:
+            RequestError: If the mapping cannot be created on the server side,
+                or if the parameters fail validation.
+        """
+        async with self._async_client(client) as client:
+            response = await client.put(
+                f"{self.base_url}/{layer.namespace}/{layer.path}",
+                **_locality_mapping(locality, geographies),
+            )
+        response.raise_for_status()
+
+
+def _geo_layer_request(
+    path: str, description: Optional[str], source_url: Optional[str]
+) -> dict[str, Any]:
+    """Builds the request arguments for creating a geographic layer."""
+    return {
+        "content": orjson.dumps(
+            {"path": path, "description": description, "source_url": source_url}
+        ),
+        "headers": JSON_HEADERS,
+    }
+
+
+def _locality_mapping(
+    locality: Union[str, Locality], geographies: list[Union[str, Geography]]
+) -> dict[str, Any]:
+    """Builds the request arguments for mapping `geographies` in `locality`."""
+    if type(geographies) in (list, tuple) and set(map(type, geographies)) <= {str}:
+        # Plain path lists (the common case for large layers) are sent as-is.
+        paths = geographies
+    else:
+        paths = [geo if isinstance(geo, str) else geo.full_path for geo in geographies]
+
+    return {
+        "params": {
+            "locality": (
+                locality.canonical_path if isinstance(locality, Locality) else locality
+            )
+        },
+        "content": orjson.dumps({"paths": paths}),
+        "headers": JSON_HEADERS,
+    }
@@ -6,13 +6,14 @@ from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
 import httpx
 from http import HTTPStatus
 import msgpack
-import shapely.wkb
+import orjson
+import shapely
 from shapely import Point
 from shapely.geometry.base import BaseGeometry
-import json
 
 from gerrydb.exceptions import RequestError, ForkingError
 from gerrydb.repos.base import (
+    HTTP_LIMITS,
     NAMESPACE_ERR,
     NamespacedObjectRepo,
     err,
@@ -44,7 +45,9 @@ def _importer_params(ctx: "WriteContext", namespace: str) -> dict[str, Any]:
 
 def _serialize_geos(geographies: GeosType) -> list[GeographyCreate]:
     """Serializes geographies into raw bytes."""
-    serialized = []
+    paths = []
+    geos = []
+    points = []
     for key, geo_pair in geographies.items():
         if isinstance(geo_pair, tuple):
             geo, point = geo_pair
@@ -54,27 +57,30 @@ def _serialize_geos(geographies: GeosType) -> list[GeographyCreate]:
         else:
             geo = point = None
 
-        serialized.append(
-            GeographyCreate(
-                path=key.full_path if isinstance(key, Geography) else key,
-                geography=None if geo is None else shapely.wkb.dumps(geo),
-                internal_point=None if point is None else shapely.wkb.dumps(point),
-            ).model_dump()
-        )
+        paths.append(key.full_path if isinstance(key, Geography) else key)
+        geos.append(geo)
+        points.append(point)
 
-    return serialized
+    # Encode all shapes in one vectorized call each (missing shapes stay `None`).
+    geos_wkb = shapely.to_wkb(geos)
+    points_wkb = shapely.to_wkb(points)
+    return [
+        GeographyCreate(
+            path=path, geography=geo_wkb, internal_point=point_wkb
+        ).model_dump()
+        for path, geo_wkb, point_wkb in zip(paths, geos_wkb, points_wkb)
+    ]
 
 
 def _parse_geo_response(response: httpx.Response) -> list[Geography]:
     """Parses `Geography` objects from a MessagePack-encoded API response."""
-    response_geos = []
-    for response_geo in msgpack.loads(response.content):
-        response_geo["geography"] = shapely.wkb.loads(response_geo["geography"])
-        response_geo["internal_point"] = shapely.wkb.loads(
-            response_geo["internal_point"]
-        )
-        response_geos.append(Geography(**response_geo))
-    return response_geos
+    response_geos = msgpack.loads(response.content)
+    geos = shapely.from_wkb([geo["geography"] for geo in response_geos])
+    points = shapely.from_wkb([geo["internal_point"] for geo in response_geos])
+    for response_geo, geo, point in zip(response_geos, geos, points):
+        response_geo["geography"] = geo
+        response_geo["internal_point"] = point
+    return [Geography(**response_geo) for response_geo in response_geos]
 
 
 @dataclass
@@ -149,7 +155,7 @@ class AsyncGeoImporter:
     async def __aenter__(self) -> "AsyncGeoImporter":
         """Creates a context for asynchronously importing geographies in bulk."""
         params = _importer_params(self.repo.ctx, self.namespace)
-        params["transport"] = httpx.AsyncHTTPTransport(retries=1)
+        params["transport"] = httpx.AsyncHTTPTransport(retries=1, limits=HTTP_LIMITS)
         self.client = httpx.AsyncClient(**params)
         return self
 
@@ -219,7 +225,7 @@ class AsyncGeoImporter:
             params=queries or {},
         )
         if response.status_code == 422:
-            json_content = json.loads(response.content)
+            json_content = orjson.loads(response.content)
             log.debug(
                 f"422 for Request: {method},\n\tAt: {self.repo.base_url}/{self.namespace}\n\tBody: {json_content}"
             )
@@ -283,9 +289,7 @@ class GeographyRepo(NamespacedObjectRepo[Geography]):
             f"/__geography_list/{namespace}/{path}/{layer_name}"
         )
         response.raise_for_status()
-        response_json = response.json()
-
-        return response_json
+        return orjson.loads(response.content)
 
     @namespaced
     @online
@@ -318,7 +322,7 @@ class GeographyRepo(NamespacedObjectRepo[Geography]):
                     f"{e.response.json().get('detail', 'No details provided.')}",
                 )
             raise e  # pragma: no cover
-        return [(item[0], item[1]) for item in response.json()]
+        return [(item[0], item[1]) for item in orjson.loads(response.content)]
 
     @namespaced
     @online
@@ -339,7 +343,7 @@ class GeographyRepo(NamespacedObjectRepo[Geography]):
         except Exception as e:
             raise RuntimeError("Failed to get layer hashes.") from e
 
-        return [(item[0], item[1]) for item in response.json()]
+        return [(item[0], item[1]) for item in orjson.loads(response.content)]
 
     @namespaced
     @online
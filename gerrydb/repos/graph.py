@@ -7,7 +7,10 @@ import sqlite3
 import io
 from datetime import datetime
 
+from pydantic import TypeAdapter
+
 from gerrydb.repos.base import (
+    JSON_HEADERS,
     NamespacedObjectRepo,
     err,
     namespaced,
@@ -39,6 +42,9 @@ try:
 except ImportError:  # pragma: no cover
     gerrychain = None
 
+# Serializes validated graphs straight to JSON bytes (edge lists can be large).
+_GRAPH_CREATE = TypeAdapter(GraphCreate)
+
 
 _EXPECTED_META_KEYS = {
     "created_at",
@@ -270,25 +276,28 @@ class GraphRepo(NamespacedObjectRepo[Graph]):
         log.debug("IN GRAPH REPO CREATE")
         response = self.ctx.client.post(
             f"{self.base_url}/{namespace}",
-            json=GraphCreate(
-                path=path,
-                locality=(
-                    locality.canonical_path
-                    if isinstance(locality, Locality)
-                    else locality
-                ),
-                layer=layer.full_path if isinstance(layer, GeoLayer) else layer,
-                description=description,
-                edges=[
-                    (
-                        geo_path_1,
-                        geo_path_2,
-                        {k: v for k, v in weights.items() if k != "id"},
-                    )
-                    for (geo_path_1, geo_path_2), weights in graph.edges.items()
-                ],
-                proj=proj,
-            ).model_dump(mode="json"),
+            content=_GRAPH_CREATE.dump_json(
+                GraphCreate(
+                    path=path,
+                    locality=(
+                        locality.canonical_path
+                        if isinstance(locality, Locality)
+                        else locality
+                    ),
+                    layer=layer.full_path if isinstance(layer, GeoLayer) else layer,
+                    description=description,
+                    edges=[
+                        (
+                            geo_path_1,
+                            geo_path_2,
+                            {k: v for k, v in weights.items() if k != "id"},
+                        )
+                        for (geo_path_1, geo_path_2), weights in graph.edges.items()
+                    ],
+                    proj=proj,
+                )
+            ),
+            headers=JSON_HEADERS,
             timeout=timeout,
         )
 
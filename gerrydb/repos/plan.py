@@ -2,7 +2,10 @@
 
 from typing import Optional, Union
 
+from pydantic import TypeAdapter
+
 from gerrydb.repos.base import (
+    JSON_HEADERS,
     NamespacedObjectRepo,
     err,
     namespaced,
@@ -11,6 +14,9 @@ from gerrydb.repos.base import (
 )
 from gerrydb.schemas import Geography, GeoLayer, Locality, Plan, PlanCreate
 
+# Serializes validated plans straight to JSON bytes (assignments can be large).
+_PLAN_CREATE = TypeAdapter(PlanCreate)
+
 
 class PlanRepo(NamespacedObjectRepo[Plan]):
     """Repository for districting plans."""
@@ -53,25 +59,28 @@ class PlanRepo(NamespacedObjectRepo[Plan]):
         """
         response = self.ctx.client.post(
             f"{self.base_url}/{namespace}",
-            json=PlanCreate(
-                path=path,
-                description=description,
-                source_url=source_url,
-                districtr_id=districtr_id,
-                daves_id=daves_id,
-                locality=(
-                    locality.canonical_path
-                    if isinstance(locality, Locality)
-                    else locality
-                ),
-                layer=layer.full_path if isinstance(layer, GeoLayer) else layer,
-                assignments={
-                    geo.full_path if isinstance(geo, Geography) else geo: str(
-                        assignment
-                    )
-                    for geo, assignment in assignments.items()
-                },
-            ).model_dump(mode="json"),
+            content=_PLAN_CREATE.dump_json(
+                PlanCreate(
+                    path=path,
+                    description=description,
+                    source_url=source_url,
+                    districtr_id=districtr_id,
+                    daves_id=daves_id,
+                    locality=(
+                        locality.canonical_path
+                        if isinstance(locality, Locality)
+                        else locality
+                    ),
+                    layer=layer.full_path if isinstance(layer, GeoLayer) else layer,
+                    assignments={
+                        geo.full_path if isinstance(geo, Geography) else geo: str(
+                            assignment
+                        )
+                        for geo, assignment in assignments.items()
+                    },
+                )
+            ),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
 
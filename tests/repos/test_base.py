@@ -1,5 +1,6 @@
 """Tests for base objects and utilities for GerryDB API object repositories."""
 
+import asyncio
 from dataclasses import dataclass
 from typing import Optional
 
@@ -21,6 +22,7 @@ from gerrydb.repos.base import (
     write_context,
     namespaced,
     normalize_path,
+    repo_method,
     NamespacedObjectRepo,
 )
 from gerrydb.schemas import BaseModel
@@ -92,6 +94,53 @@ def test_namespaced_decorator__no_namespace(dummy_repo_offline):
         fn(dummy_repo_offline, "foo")
 
 
+def test_repo_method_decorator__http():
+    @repo_method("askew")
+    def fn(repo: DummyRepo):
+        raise httpx.HTTPError("request failed")
+
+    with pytest.raises(ResultError, match="askew: HTTP"):
+        fn(None)
+
+
+def test_repo_method_decorator__async_http():
+    @repo_method("askew")
+    async def fn(repo: DummyRepo):
+        raise httpx.HTTPError("request failed")
+
+    with pytest.raises(ResultError, match="askew: HTTP"):
+        asyncio.run(fn(None))
+
+
+def test_repo_method_decorator__offline(dummy_repo_offline):
+    @repo_method("askew", online=True)
+    def fn(repo: DummyRepo):
+        """Needs to be online."""
+
+    with pytest.raises(OnlineError):
+        fn(dummy_repo_offline)
+
+
+def test_repo_method_decorator__no_write_context(dummy_repo_offline):
+    @repo_method("askew", write=True)
+    def fn(repo: DummyRepo):
+        """Needs a write context."""
+
+    with pytest.raises(WriteContextError):
+        fn(dummy_repo_offline)
+
+
+def test_repo_method_decorator__namespaced(dummy_repo_offline):
+    @repo_method("askew", namespaced=True)
+    def fn(repo: DummyRepo, path: str, namespace: Optional[str] = None):
+        return path, namespace
+
+    assert fn(dummy_repo_offline, "foo", "bar") == ("foo", "bar")
+    assert fn(dummy_repo_offline, path="foo", namespace="bar") == ("foo", "bar")
+    with pytest.raises(RequestError):
+        fn(dummy_repo_offline, "foo")
+
+
 def test_bad_normalize_path():
     with pytest.raises(GerryPathError, match="Invalid path"):
         normalize_path("foo;bar")
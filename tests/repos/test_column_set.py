@@ -1,7 +1,13 @@
 """Integration/VCR tests for columns."""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
+from gerrydb import GerryDB
 from gerrydb.exceptions import RequestError
+from gerrydb.repos.column_set import ColumnSetRepo
+from gerrydb.schemas import ColumnSet
 
 
 @pytest.mark.vcr
@@ -63,3 +69,72 @@ def test_column_set_repo_create_bad_col_ns(client_ns):
                 description="Total population columns",
                 columns=["bad_ns/bad_path"],
             )
+
+
+@pytest.mark.vcr
+def test_column_set_repo_create_bulk(client_ns, pop_column_meta, vap_column_meta):
+    with client_ns.context(notes="adding two column sets in bulk") as ctx:
+        pop_col = ctx.columns.create(**pop_column_meta)
+        vap_col = ctx.columns.create(**vap_column_meta)
+        col_sets = ctx.column_sets.create_bulk(
+            [
+                {
+                    "path": "pop_totals",
+                    "description": "Total population columns",
+                    "columns": [pop_col],
+                },
+                {
+                    "path": "vap_totals",
+                    "description": "Total voting-age population columns",
+                    "columns": [vap_col, "total_pop"],
+                },
+            ]
+        )
+
+    assert [col_set.path for col_set in col_sets] == ["pop_totals", "vap_totals"]
+    assert {col.canonical_path for col in col_sets[1].columns} == {
+        "total_pop",
+        "total_vap",
+    }
+    assert client_ns.column_sets["vap_totals"] == col_sets[1]
+
+
+@pytest.mark.vcr
+def test_column_set_repo_async_create(client_ns, pop_column_meta):
+    with client_ns.context(notes="adding a column set asynchronously") as ctx:
+        pop_col = ctx.columns.create(**pop_column_meta)
+        col_set = asyncio.run(
+            ctx.column_sets.async_create(
+                "pop_totals",
+                description="Total population columns",
+                columns=[pop_col],
+            )
+        )
+
+    assert [col.canonical_path for col in col_set.columns] == ["total_pop"]
+    assert client_ns.column_sets["pop_totals"] == col_set
+
+
+def test_column_set_repo_create_bulk__bad_entry_sends_nothing(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(
+        ColumnSetRepo,
+        "_gather_with_client",
+        lambda self, make_coros, max_conns: scheduled.append(make_coros),
+    )
+    repo = ColumnSetRepo(
+        schema=ColumnSet,
+        base_url="/column-sets",
+        session=GerryDB(host="example.com", key="", namespace="ns"),
+        ctx=SimpleNamespace(),
+    )
+
+    with pytest.raises(RequestError, match="same namespace"):
+        repo.create_bulk(
+            [
+                {"path": "good1", "columns": ["total_pop"], "description": "ok"},
+                {"path": "bad", "columns": ["other/total_vap"], "description": "x"},
+                {"path": "good2", "columns": ["total_vap"], "description": "ok"},
+            ]
+        )
+    assert scheduled == []
@@ -1,7 +1,13 @@
 """Integration/VCR tests for geographic layers."""
 
+import asyncio
+
+import orjson
+import pandas as pd
 import pytest
 
+from gerrydb.repos.geo_layer import _locality_mapping
+
 
 @pytest.mark.vcr
 def test_geo_layer_repo_create_get(client_ns):
@@ -23,3 +29,66 @@ def test_geo_layer_repo_create_all(client_ns):
         ctx.geo_layers.create("blocks/2020", description="2020 Census blocks")
 
     assert "blocks/2020" in [layer.path for layer in client_ns.geo_layers.all()]
+
+
+@pytest.mark.vcr
+def test_geo_layer_repo_create_bulk(client_ns):
+    with client_ns.context(notes="adding geographic layers in bulk") as ctx:
+        layers = ctx.geo_layers.create_bulk(
+            [
+                {"path": "counties", "description": "2020 Census counties"},
+                {
+                    "path": "tracts",
+                    "description": "2020 Census tracts",
+                    "source_url": "https://www.census.gov/",
+                },
+            ]
+        )
+
+    assert [layer.path for layer in layers] == ["counties", "tracts"]
+    assert client_ns.geo_layers["tracts"] == layers[1]
+
+
+@pytest.mark.vcr
+def test_geo_layer_repo_async_create(client_ns):
+    async def create_layers(ctx):
+        return await asyncio.gather(
+            ctx.geo_layers.async_create("counties", description="2020 Census counties"),
+            ctx.geo_layers.async_create("tracts", description="2020 Census tracts"),
+        )
+
+    with client_ns.context(notes="adding geographic layers asynchronously") as ctx:
+        layers = asyncio.run(create_layers(ctx))
+
+    assert [layer.path for layer in layers] == ["counties", "tracts"]
+    assert client_ns.geo_layers["counties"] == layers[0]
+
+
+@pytest.mark.vcr
+def test_geo_layer_repo_async_map_locality(client_with_ia_layer_loc):
+    client_ns, layer, _, _ = client_with_ia_layer_loc
+
+    with client_ns.context(notes="mapping a county-level locality in Iowa") as ctx:
+        county_loc = ctx.localities.create(
+            canonical_path="iowa.dubuque3", name="Dubuque County version 3, Iowa"
+        )
+        asyncio.run(
+            ctx.geo_layers.async_map_locality(
+                layer=layer, locality=county_loc, geographies=["19061"]
+            )
+        )
+
+    paths = client_ns.geo.all_paths(county_loc.canonical_path, layer_name=layer.path)
+    assert [path.rsplit("/", 1)[-1] for path in paths] == ["19061"]
+
+
+@pytest.mark.parametrize(
+    "make_geos",
+    [list, tuple, iter, pd.Series, pd.Index],
+    ids=["list", "tuple", "generator", "series", "index"],
+)
+def test_locality_mapping_accepts_path_iterables(make_geos):
+    request = _locality_mapping("iowa", make_geos(["ns/19059", "ns/19061"]))
+
+    assert request["params"] == {"locality": "iowa"}
+    assert orjson.loads(request["content"]) == {"paths": ["ns/19059", "ns/19061"]}
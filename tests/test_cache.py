@@ -2,7 +2,7 @@
 
 import pytest
 
-from gerrydb.cache import CacheInitError, GerryCache
+from gerrydb.cache import _EVICTION_QUERY, CacheInitError, GerryCache
 from tempfile import TemporaryDirectory
 from pathlib import Path
 from datetime import datetime
@@ -39,6 +39,12 @@ def test_gerry_cache_bad_init__no_conn():
         )
 
 
+def test_gerry_cache_init__file_pragmas(tmp_path):
+    cache = GerryCache(tmp_path / "cache.db", data_dir=tmp_path)
+    assert cache._conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert cache._conn.execute("PRAGMA synchronous").fetchone() == (1,)
+
+
 def test_gerry_cache_init__no_schema_version(cache):
     cache._conn.execute("DELETE FROM cache_meta")
     cache._conn.commit()
@@ -60,6 +66,101 @@ def test_gerry_cache_init__missing_table(cache):
         GerryCache(cache._conn, cache.data_dir)
 
 
+def _schema_v0_conn(iso_times: dict[str, str]) -> sqlite3.Connection:
+    """A schema version 0 cache, as written by older clients (ISO 8601 `cached_at`)."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE cache_meta(key TEXT PRIMARY KEY, value TEXT)")
+    for table in ("view", "graph"):
+        conn.execute(
+            f"""CREATE TABLE {table}(
+                namespace        TEXT       NOT NULL,
+                path             TEXT       NOT NULL,
+                render_id        TEXT       NOT NULL,
+                cached_at        TIMESTAMP  NOT NULL,
+                file_size_kb     BIGINTEGER NOT NULL,
+                UNIQUE(namespace, path)
+            )"""
+        )
+    conn.execute("INSERT INTO cache_meta (key, value) VALUES ('schema_version', '0')")
+    conn.executemany(
+        "INSERT INTO graph (namespace, render_id, path, cached_at, file_size_kb) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [("ns", render_id, render_id, ts, 1) for render_id, ts in iso_times.items()],
+    )
+    conn.commit()
+    return conn
+
+
+def test_gerry_cache_init__migrates_schema_v0(tmp_path):
+    iso_times = {"old": "2024-01-01T00:00:00.250000", "new": "2024-06-01T12:30:00"}
+    conn = _schema_v0_conn(iso_times)
+
+    GerryCache(conn, data_dir=tmp_path)
+
+    schema_version = conn.execute(
+        "SELECT value FROM cache_meta WHERE key='schema_version'"
+    ).fetchone()
+    assert schema_version == ("1",)
+    rows = conn.execute(
+        "SELECT render_id, cached_at FROM graph ORDER BY cached_at ASC"
+    ).fetchall()
+    assert [row[0] for row in rows] == ["old", "new"]
+    for render_id, cached_at in rows:
+        expected = datetime.fromisoformat(iso_times[render_id]).timestamp() * 1e6
+        assert isinstance(cached_at, int)
+        assert abs(cached_at - expected) < 1000
+    assert conn.execute(
+        "SELECT COUNT(*) FROM graph "
+        "WHERE queued_at != cached_at OR hits != 0 OR queue != 'small'"
+    ).fetchone() == (0,)
+    indexes = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    assert {"view_queued_at_idx", "graph_queued_at_idx"} <= indexes
+
+
+def test_gerry_cache_init__failed_migration_leaves_cache_unchanged(
+    tmp_path, monkeypatch
+):
+    conn = _schema_v0_conn({"old": "2024-01-01T00:00:00"})
+    monkeypatch.setattr(
+        "gerrydb.cache._SCHEMA_MIGRATIONS",
+        {
+            "0": (
+                "1",
+                [
+                    "ALTER TABLE graph ADD COLUMN extra INTEGER",
+                    "UPDATE no_such_table SET value = 1",
+                ],
+            )
+        },
+    )
+
+    for _ in range(2):
+        with pytest.raises(CacheInitError, match="schema version 0 to 1"):
+            GerryCache(conn, data_dir=tmp_path)
+
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(graph)")}
+    assert "extra" not in columns
+    assert conn.execute(
+        "SELECT value FROM cache_meta WHERE key='schema_version'"
+    ).fetchone() == ("0",)
+    assert conn.execute("SELECT cached_at FROM graph").fetchone() == (
+        "2024-01-01T00:00:00",
+    )
+
+
+@pytest.mark.parametrize("table", ["graph", "view"])
+def test_eviction_scan_uses_queued_at_index(cache, table):
+    plan = cache._conn.execute(
+        f"EXPLAIN QUERY PLAN {_EVICTION_QUERY.format(table=table)}"
+    ).fetchall()
+    details = [row[-1] for row in plan]
+    assert any(f"{table}_queued_at_idx" in detail for detail in details)
+    assert not any("TEMP B-TREE" in detail for detail in details)
+
+
 def test_get_missing_graph_gpkg(cache):
     assert cache.get_graph_gpkg("foo", "bar") is None
 
@@ -118,6 +219,89 @@ def test_eviction_policy(tmp_path, cache_small):
     assert rows == [("r2",)]
 
 
+def test_eviction_policy_multiple(tmp_path):
+    cache = GerryCache(":memory:", data_dir=tmp_path, max_size_gb=3 / (1024 * 1024))
+    ns = "ns_multi"
+    for idx in range(1, 4):
+        cache.upsert_graph_gpkg(ns, f"p{idx}", f"r{idx}", b"x" * 512)  # 1 KB each
+    cache.upsert_graph_gpkg(ns, "p4", "r4", b"y" * 1500)  # 2 KB
+
+    assert not (tmp_path / "r1.gpkg").exists()
+    assert not (tmp_path / "r2.gpkg").exists()
+    assert (tmp_path / "r3.gpkg").exists()
+    assert (tmp_path / "r4.gpkg").exists()
+
+    rows = cache._conn.execute("SELECT render_id FROM graph").fetchall()
+    assert sorted(rows) == [("r3",), ("r4",)]
+
+
+def test_eviction_policy_keeps_recently_read_renders(tmp_path):
+    cache = GerryCache(":memory:", data_dir=tmp_path, max_size_gb=3 / (1024 * 1024))
+    ns = "ns_lru"
+    for idx in range(1, 4):
+        cache.upsert_view_gpkg(ns, f"p{idx}", f"r{idx}", b"x" * 512)  # 1 KB each
+    assert cache.get_view_gpkg(ns, "p1") is not None  # r1 is oldest, but reused.
+    cache.upsert_view_gpkg(ns, "p4", "r4", b"y" * 1500)  # 2 KB
+
+    assert (tmp_path / "r1.gpkg").exists()
+    assert not (tmp_path / "r2.gpkg").exists()
+    assert not (tmp_path / "r3.gpkg").exists()
+    assert (tmp_path / "r4.gpkg").exists()
+
+    rows = cache._conn.execute("SELECT render_id FROM view").fetchall()
+    assert sorted(rows) == [("r1",), ("r4",)]
+
+
+def test_eviction_policy_ages_out_stale_reads(tmp_path):
+    cache = GerryCache(":memory:", data_dir=tmp_path, max_size_gb=3 / (1024 * 1024))
+    ns = "ns_stale"
+    for path in ("a", "b"):
+        cache.upsert_view_gpkg(ns, path, f"r_{path}", b"x" * 512)  # 1 KB each
+        assert cache.get_view_gpkg(ns, path) is not None
+
+    misses = 0
+    for _ in range(6):
+        for path in ("f", "g"):
+            if cache.get_view_gpkg(ns, path) is None:
+                misses += 1
+                cache.upsert_view_gpkg(ns, path, f"r_{path}", b"y" * 512)
+
+    # `f` and `g` are each evicted from probation once, then readmitted to the
+    # main queue from the ghost queue.
+    assert misses == 4
+    rows = cache._conn.execute("SELECT path FROM view").fetchall()
+    assert sorted(rows) == [("b",), ("f",), ("g",)]
+
+
+def test_eviction_policy_resists_scans(tmp_path):
+    cache = GerryCache(":memory:", data_dir=tmp_path, max_size_gb=3 / (1024 * 1024))
+    ns = "ns_scan"
+    cache.upsert_view_gpkg(ns, "hot", "r_hot", b"x" * 512)  # 1 KB
+    for _ in range(50):
+        assert cache.get_view_gpkg(ns, "hot") is not None
+
+    for idx in range(10):
+        cache.upsert_view_gpkg(ns, f"once_{idx}", f"r_once_{idx}", b"y" * 512)
+
+    assert cache.get_view_gpkg(ns, "hot") is not None
+    rows = cache._conn.execute("SELECT path, queue FROM view").fetchall()
+    assert sorted(rows) == [("hot", "main"), ("once_8", "small"), ("once_9", "small")]
+
+
+def test_get_view_gpkg__does_not_write(tmp_path):
+    cache = GerryCache(tmp_path / "cache.db", data_dir=tmp_path)
+    gpkg_path = cache.upsert_view_gpkg("ns", "p", "r", b"x" * 512)
+    changes = cache._conn.total_changes
+
+    writer = sqlite3.connect(tmp_path / "cache.db", timeout=0)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        assert cache.get_view_gpkg("ns", "p") == gpkg_path
+        assert cache._conn.total_changes == changes
+    finally:
+        writer.rollback()
+
+
 def test_upsert_and_get_view(tmp_path, cache_small):
     ns, path, rid = "ns4", "vpath", "v1"
     content = b"viewdata"